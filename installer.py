@@ -4,6 +4,7 @@ import sys
 import signal
 import shutil
 import subprocess
+import tempfile
 from argparse import ArgumentParser, HelpFormatter
 from types import FrameType
 
@@ -14,6 +15,9 @@ from facefusion.common_helper import is_linux
 ONNXRUNTIME_PKG = "onnxruntime-gpu"
 ONNXRUNTIME_VERSION = "1.22.0"
 
+PIP_EXECUTABLE = shutil.which("pip")
+CONDA_EXECUTABLE = shutil.which("conda")
+
 
 def main():
     signal.signal(signal.SIGINT, handle_sigint)
@@ -40,25 +44,34 @@ def main():
         sys.exit(1)
 
     # If they want Conda-based install, require CONDA_PREFIX
-    has_conda = "CONDA_PREFIX" in os.environ
+    conda_prefix = os.environ.get("CONDA_PREFIX")
+    has_conda = conda_prefix is not None
     if not args.skip_conda and not has_conda:
         sys.stderr.write(wording.get("conda_not_activated") + os.linesep)
         sys.exit(1)
 
-    pip = shutil.which("pip")
+    pip = PIP_EXECUTABLE
     if pip is None:
         sys.stderr.write("Error: pip not found in PATH.\n")
         sys.exit(1)
 
-    # 1) Install all other requirements
-    with open("requirements.txt", encoding="utf-8") as reqs:
-        for line in reqs:
-            pkg = line.strip()
-            if not pkg or pkg.startswith("#"):
-                continue
-            if pkg.startswith("onnxruntime"):
-                continue
-            subprocess.check_call([pip, "install", pkg, "--force-reinstall"])
+    # 1) Install all other requirements in a single resolver run
+    # keep the filtered file next to requirements.txt so nested -r/-c includes still resolve
+    reqs_path = os.path.abspath("requirements.txt")
+    reqs_dir = os.path.dirname(reqs_path)
+    with open(reqs_path, encoding="utf-8") as reqs:
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", suffix=".txt", dir=reqs_dir
+        ) as filtered_reqs:
+            for line in reqs:
+                pkg = line.strip()
+                if not pkg or pkg.startswith("#"):
+                    continue
+                if pkg.startswith("onnxruntime"):
+                    continue
+                filtered_reqs.write(pkg + "\n")
+            filtered_reqs.flush()
+            subprocess.check_call([pip, "install", "-r", filtered_reqs.name, "--force-reinstall"])
 
     # 2) Install onnxruntime-gpu
     gpu_pkg = f"{ONNXRUNTIME_PKG}=={ONNXRUNTIME_VERSION}"
@@ -66,16 +79,16 @@ def main():
 
     # 3) If using Conda, update LD_LIBRARY_PATH so TensorRT libs are picked up
     if has_conda:
-        prefix = os.environ["CONDA_PREFIX"]
-        ld_paths = os.getenv("LD_LIBRARY_PATH", "").split(os.pathsep) if os.getenv("LD_LIBRARY_PATH") else []
+        ld_library_path = os.environ.get("LD_LIBRARY_PATH")
+        ld_paths = ld_library_path.split(os.pathsep) if ld_library_path else []
         python_dir = f"python{sys.version_info.major}.{sys.version_info.minor}"
         candidates = [
-            os.path.join(prefix, "lib"),
-            os.path.join(prefix, "lib", python_dir, "site-packages", "tensorrt_libs"),
+            os.path.join(conda_prefix, "lib"),
+            os.path.join(conda_prefix, "lib", python_dir, "site-packages", "tensorrt_libs"),
         ]
         # keep only existing, unique paths
         ld_paths = list(dict.fromkeys(p for p in ld_paths + candidates if os.path.isdir(p)))
-        conda = shutil.which("conda")
+        conda = CONDA_EXECUTABLE
         if conda is None:
             sys.stderr.write("Warning: conda not found; skipping LD_LIBRARY_PATH setup.\n")
         else: